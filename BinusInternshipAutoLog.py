@@ -2,27 +2,108 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, scrolledtext, ttk
 import threading
 import asyncio
+import concurrent.futures
+import contextvars
+import queue
 import requests
 import os
 from playwright.async_api import async_playwright
 import sys
 import json
 from collections import defaultdict
-from utility import get_all_days, parse_flexible_date, convert_to_12h, generate_template
+from utility import get_missing_days, parse_flexible_date, convert_to_12h, generate_template
+import run_log
 from datetime import datetime
 import argparse
+import time
 import pandas as pd
 
 cookie = None
 month_header_dict = None
-last_browser = None  # Global variable to hold the previous browser instance
+active_runs = {}  # Cancel event -> info of each login/submission run in progress
+active_runs_lock = threading.Lock()
+gui_log_queue = queue.Queue()  # (message, color) lines waiting for the Tk thread to show them
 
 # Parse command-line arguments
 parser = argparse.ArgumentParser(description="Run BINUS logbook automation.")
 parser.add_argument("--debug", action="store_true", help="Enable debugging mode.")
+parser.add_argument("--timeout", type=int, default=600, help="Seconds before a login or submission run is cancelled.")
+parser.add_argument("--browser-idle-timeout", type=int, default=300, help="Seconds an unused browser is kept warm before closing.")
 args = parser.parse_args()
 
 debugging_mode = args.debug
+run_timeout = args.timeout
+REQUEST_TIMEOUT = 30  # Seconds to wait on a single HTTP request
+
+def new_deadline():
+    # Register a new run and return its own cancel event and the monotonic time it must finish by
+    cancel = threading.Event()
+    with active_runs_lock:
+        active_runs[cancel] = {"run_id": None, "on_cancel": None}
+    return cancel, time.monotonic() + run_timeout
+
+def begin_run(cancel, kind):
+    # Call from the worker thread so its log lines, and Cancel's line for it, carry the run ID
+    run_id = run_log.start_run(kind)
+    with active_runs_lock:
+        if cancel in active_runs:
+            active_runs[cancel]["run_id"] = run_id
+    log_message(f"Run ID: {run_id}")
+
+def finish_run(cancel):
+    with active_runs_lock:
+        active_runs.pop(cancel, None)
+
+def should_stop(cancel=None, deadline=None):
+    if cancel is not None and cancel.is_set():
+        return True
+    if deadline is not None and time.monotonic() > deadline:
+        log_message("⚠️ Run deadline reached, stopping...")
+        if cancel is not None:
+            cancel.set()
+        return True
+    return False
+
+def cancel_run():
+    with active_runs_lock:
+        runs = list(active_runs.items())
+    for cancel, info in runs:
+        if not cancel.is_set():
+            log_message("⚠️ Cancel requested, waiting for in-flight request to finish...", run_id=info["run_id"])
+        cancel.set()
+        if info["on_cancel"]:
+            info["on_cancel"]()
+
+async def run_cancellable(coro, cancel=None, deadline=None):
+    # Run the coroutine as a task that Cancel or the deadline cancel directly on this loop
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(coro)
+
+    def on_deadline():
+        log_message("⚠️ Run deadline reached, stopping...")
+        if cancel is not None:
+            cancel.set()
+        task.cancel()
+
+    deadline_handle = None
+    if deadline is not None:
+        deadline_handle = loop.call_later(max(0, deadline - time.monotonic()), on_deadline)
+    if cancel is not None:
+        with active_runs_lock:
+            if cancel in active_runs:
+                active_runs[cancel]["on_cancel"] = lambda: loop.call_soon_threadsafe(task.cancel)
+        if cancel.is_set():
+            task.cancel()
+
+    try:
+        return await task
+    finally:
+        if deadline_handle:
+            deadline_handle.cancel()
+        if cancel is not None:
+            with active_runs_lock:
+                if cancel in active_runs:
+                    active_runs[cancel]["on_cancel"] = None
 
 def get_header_id_for_date(month_header_dict, date_str):
     # If date_str is already a datetime object, use it directly
@@ -57,26 +138,129 @@ browser_path = get_runtime_browser_path()
 if browser_path:
     os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browser_path
 
-async def launch_and_get_cookie_and_header_async(email, password):
-    log_message("Starting Playwright task...")
-    global last_browser
+class BrowserPool:
+    """
+    Keeps one Playwright driver and WebKit browser alive on a dedicated event loop thread.
+    Each login gets its own isolated context; the browser is closed after sitting idle.
+    """
+
+    def __init__(self, idle_timeout):
+        self.idle_timeout = idle_timeout
+        self.loop = None
+        self.loop_lock = threading.Lock()
+        self.playwright = None
+        self.browser = None
+        self.launch_lock = None
+        self.active_contexts = 0
+        self.idle_handle = None
+
+    def submit(self, coro):
+        # Schedule a coroutine on the pool's loop from any thread, starting the loop on first use
+        with self.loop_lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def is_healthy(self):
+        return self.browser is not None and self.browser.is_connected()
+
+    def lock(self):
+        # Guards launching and closing; created lazily so it belongs to the pool's loop
+        if self.launch_lock is None:
+            self.launch_lock = asyncio.Lock()
+        return self.launch_lock
+
+    async def get_browser(self):
+        # Caller must hold self.lock()
+        if self.is_healthy():
+            log_message("   ♻️ Reusing warm browser.")
+            return self.browser
+
+        if self.browser is not None:
+            log_message("   ⚠️ Browser is no longer connected, restarting it...")
+        await self.close()
+
+        log_message("   Launching Headless browser...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.webkit.launch(headless=True)
+        return self.browser
+
+    async def new_context(self, **kwargs):
+        # Count the context before the first await so a pending idle close leaves the browser alone
+        self.active_contexts += 1
+        if self.idle_handle:
+            self.idle_handle.cancel()
+            self.idle_handle = None
 
-    try:
-        async with async_playwright() as p:
-                # Close previous browser if it exists
-            if last_browser:
-                log_message("🔁 Closing previous browser instance...")
+        try:
+            async with self.lock():
+                browser = await self.get_browser()
                 try:
-                    await last_browser.close()
-                    log_message("✅ Previous browser closed.")
+                    return await browser.new_context(**kwargs)
                 except Exception as e:
-                    log_message(f"⚠️ Error closing previous browser: {e}")
-                last_browser = None
-            log_message("   Launching Headless browser...")
+                    # The browser may have died since the health check, relaunch once and retry
+                    log_message(f"   ⚠️ Could not open browser context: {e}")
+                    await self.close()
+                    browser = await self.get_browser()
+                    return await browser.new_context(**kwargs)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        self.active_contexts -= 1
+        if self.active_contexts == 0:
+            # Empty context: the idle close belongs to no run, not to the login that released last
+            self.idle_handle = self.loop.call_later(
+                self.idle_timeout, lambda: asyncio.ensure_future(self.close_if_idle()), context=contextvars.Context()
+            )
+
+    async def close_if_idle(self):
+        self.idle_handle = None
+        async with self.lock():
+            # A login may have started while this close was waiting for the lock
+            if self.active_contexts == 0 and self.browser is not None:
+                await self.close()
+                log_message("Warm browser closed after being idle.")
+
+    async def close_locked(self):
+        async with self.lock():
+            await self.close()
+
+    async def close(self):
+        # Caller must hold self.lock()
+        if self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                log_message(f"⚠️ Error closing browser: {e}")
+            self.browser = None
+        if self.playwright is not None:
+            try:
+                await self.playwright.stop()
+            except Exception as e:
+                log_message(f"⚠️ Error stopping Playwright: {e}")
+            self.playwright = None
+
+    def shutdown(self, timeout=5):
+        # Called from the GUI thread when the app exits
+        if self.loop is None:
+            return
+        try:
+            self.submit(self.close_locked()).result(timeout=timeout)
+        except Exception as e:
+            log_message(f"⚠️ Browser did not close cleanly: {e!r}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
 
-            browser = await p.webkit.launch(headless=True)
-            last_browser = browser  # Store the reference to this new browser
-            context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+browser_pool = BrowserPool(args.browser_idle_timeout)
+
+async def launch_and_get_cookie_and_header_async(email, password):
+    log_message("Starting Playwright task...")
+
+    try:
+        context = await browser_pool.new_context(viewport={"width": 1920, "height": 1080})
+        try:
             page = await context.new_page()
 
             # Step 1: Go to the enrichment site
@@ -109,7 +293,7 @@ async def launch_and_get_cookie_and_header_async(email, password):
             try:
                 await page.click('input#idBtn_Back')  # If "No" button exists, click it
                 log_message("   Clicked 'No' button.")
-            except:
+            except Exception:
                 log_message("   'No' button not found or not clickable.")
 
             log_message("   Waiting for 'Go to Activity Enrichment Apps' button...")
@@ -203,9 +387,15 @@ async def launch_and_get_cookie_and_header_async(email, password):
             cookie_header = "; ".join([f"{c['name']}={c['value']}" for c in cookies])
             log_message("   Cookies extracted.")
 
-            await browser.close()
-            log_message("   Browser closed.")
             return cookie_header, month_header_dict
+        finally:
+            # Only this login's context is closed, the browser stays warm for the next login
+            try:
+                await context.close()
+            except Exception as e:
+                log_message(f"   ⚠️ Error closing browser context: {e}")
+            finally:
+                browser_pool.release()
 
     except Exception as e:
         log_message(f"  Error in Playwright task: {e}")
@@ -272,7 +462,8 @@ def ask_for_credentials(parent, title="Login", prompt1="Enter your email:", prom
     dialog = CustomDialog(parent, title, prompt1, prompt2)
     return dialog.result
 
-def fetch_existing_entries(header_id, cookie):
+def fetch_logbook_records(header_id, cookie):
+    # Returns {date: record} for one month, or None if the request failed
     try:
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
@@ -282,18 +473,113 @@ def fetch_existing_entries(header_id, cookie):
         response = requests.post(
             "https://activity-enrichment.apps.binus.ac.id/LogBook/GetLogBook",
             headers=headers,
-            data={"logBookHeaderID": header_id}
+            data={"logBookHeaderID": header_id},
+            timeout=REQUEST_TIMEOUT
         )
 
         response.raise_for_status()
         data = response.json().get("data", [])
-        return {entry["date"][:10]: entry["id"] for entry in data}
+        return {entry["date"][:10]: entry for entry in data}
     except Exception as e:
         log_message(f"❌ Failed to fetch existing entries: {e}")
-        return {}
-
+        return None
 
-def log_message(message):
+def fetch_existing_entries(header_id, cookie):
+    records = fetch_logbook_records(header_id, cookie) or {}
+    return {date: record["id"] for date, record in records.items()}
+
+# Payload field -> GetLogBook record field, compared during verification
+VERIFIED_FIELDS = {
+    "model[Activity]": "activity",
+    "model[ClockIn]": "clockIn",
+    "model[ClockOut]": "clockOut",
+    "model[Description]": "description",
+}
+
+CLOCK_FIELDS = {"model[ClockIn]", "model[ClockOut]"}
+
+def normalize_field(field, value):
+    value = str(value or "").strip()
+    if field in CLOCK_FIELDS:
+        # Compare times by value, not by how the server happens to format them
+        try:
+            return convert_to_12h(value)
+        except ValueError:
+            pass
+    return value.lower()
+
+def record_matches(record, payload):
+    # Caller must check that the record has every field in VERIFIED_FIELDS
+    for payload_field, record_field in VERIFIED_FIELDS.items():
+        stored = normalize_field(payload_field, record.get(record_field))
+        expected = normalize_field(payload_field, payload.get(payload_field))
+        if stored != expected:
+            return False
+    return True
+
+def verify_submissions(submitted, cookie, cancel=None, deadline=None):
+    """
+    Re-reads each affected month once. Returns the payloads whose stored record differs,
+    pointed at that record's ID, and the dates that could not be verified.
+    """
+    by_header = defaultdict(list)
+    for payload in submitted:
+        by_header[payload["model[LogBookHeaderID]"]].append(payload)
+
+    mismatches = []
+    unverified = []
+    for header_id, payloads in by_header.items():
+        dates = [payload["model[Date]"][:10] for payload in payloads]
+        if should_stop(cancel, deadline):
+            log_message("⚠️ Verification stopped before all months were checked.")
+            unverified += dates
+            continue
+
+        records = fetch_logbook_records(header_id, cookie)
+        if records is None:
+            log_message(f"⚠️ Could not verify {len(payloads)} entries for header {header_id}.")
+            unverified += dates
+            continue
+
+        warned_missing = False
+        for payload, date_key in zip(payloads, dates):
+            record = records.get(date_key)
+            if record is None:
+                # Re-posting without the stored ID could create a duplicate, so only report it
+                log_message(f"⚠️ No stored entry found for {date_key}, cannot verify it.")
+                unverified.append(date_key)
+                continue
+
+            missing = [field for field in VERIFIED_FIELDS.values() if field not in record]
+            if missing:
+                if not warned_missing:
+                    log_message(f"⚠️ Stored entries for header {header_id} have no {', '.join(missing)}, cannot verify them.")
+                    warned_missing = True
+                unverified.append(date_key)
+                continue
+
+            if record_matches(record, payload):
+                continue
+
+            log_message(f"⚠️ Stored entry for {date_key} does not match what was sent.")
+            # Point the resubmission at the stored record so it is updated, not duplicated
+            mismatches.append({**payload, "model[ID]": record["id"]})
+
+    log_message(f"Verification checked {len(submitted)} entries, {len(mismatches)} mismatched, {len(unverified)} unverified.")
+    return mismatches, unverified
+
+def submit_entry(url, headers, payload):
+    if not debugging_mode:
+        return requests.post(url, headers=headers, data=payload, timeout=REQUEST_TIMEOUT)
+
+    class MockResponse:
+        ok = True
+        status_code = 200
+        text = 'Debug mode: simulated response'
+    return MockResponse()
+
+
+def log_message(message, run_id=None):
     if debugging_mode == True:
         prefix = "[DEBUG]"
     else:
@@ -314,17 +600,29 @@ def log_message(message):
     full_message = f"{timestamp} {message}"
     print(full_message)
 
-    with open("debug_log.txt", "a", encoding="utf-8") as f:
-        f.write(full_message + "\n")
-    
-    output_box.insert(tk.END, message + "\n", color)
-    output_box.tag_config("green", foreground="green")
-    output_box.tag_config("red", foreground="red")
-    output_box.tag_config("blue", foreground="blue")
-    output_box.tag_config("black", foreground="black")
-    output_box.see(tk.END)
-
-def process_logbook(csv_path, cookie, edit=False, month_header_dict=None):
+    run_log.write(message, run_id=run_id)
+
+    # Worker threads must not touch Tk, the GUI thread picks this up in drain_log_queue
+    gui_log_queue.put((message, color))
+
+def drain_log_queue():
+    while True:
+        try:
+            message, color = gui_log_queue.get_nowait()
+        except queue.Empty:
+            break
+        output_box.insert(tk.END, message + "\n", color)
+        output_box.see(tk.END)
+    root.after(100, drain_log_queue)
+
+def report_run_summary(sent, failed, not_sent):
+    log_message(f"Run summary: {len(sent)} sent, {len(failed)} failed, {len(not_sent)} not sent.")
+    if failed:
+        log_message(f"❌ Failed: {', '.join(failed)}")
+    if not_sent:
+        log_message(f"⚠️ Not sent: {', '.join(not_sent)}")
+
+def process_logbook(csv_path, cookie, edit=False, month_header_dict=None, cancel=None, deadline=None, verify=False):
     # if debugging_mode == True:
     #     pdb.set_trace()
     log_message(f"Edit mode: {edit}")
@@ -332,6 +630,8 @@ def process_logbook(csv_path, cookie, edit=False, month_header_dict=None):
     invalid_rows = []
     active_days = 0
     month_entries = defaultdict(list)
+    sent, failed, not_sent = [], [], []
+    submitted = []  # Payloads the server accepted, kept for verification
 
     try:
         df = pd.read_csv(csv_path, encoding='utf-8-sig')
@@ -384,7 +684,8 @@ def process_logbook(csv_path, cookie, edit=False, month_header_dict=None):
                     "model[Description]": activity
                 }
 
-                if edit:
+                # Once cancelled, keep parsing so the summary is complete but skip the lookups
+                if edit and not should_stop(cancel, deadline):
                     existing_entries = fetch_existing_entries(header_id, cookie)
                     entry["model[ID]"] = existing_entries.get(date_key, "00000000-0000-0000-0000-000000000000")
 
@@ -393,6 +694,14 @@ def process_logbook(csv_path, cookie, edit=False, month_header_dict=None):
         except Exception as e:
             invalid_rows.append(f"{row.to_dict()} ({e})")
 
+    if should_stop(cancel, deadline):
+        # Nothing has been posted yet: report every active entry and auto-filled OFF day
+        not_sent = [entry['model[Date]'][:10] for entries in month_entries.values() for entry in entries]
+        not_sent += [day.isoformat() for day in get_missing_days(handled_dates)]
+        log_message("⚠️ Run cancelled before any entries were sent.")
+        report_run_summary(sent, failed, not_sent)
+        return
+
     if invalid_rows:
         log_message("❌ Process aborted due to invalid row(s):")
         for err in invalid_rows:
@@ -412,71 +721,101 @@ def process_logbook(csv_path, cookie, edit=False, month_header_dict=None):
 
     for month, entries in month_entries.items():
         for entry in entries:
+            date_display = entry['model[Date]'][:10]
+            if should_stop(cancel, deadline):
+                not_sent.append(date_display)
+                continue
+
             try:
-                if not debugging_mode:
-                    response = requests.post(url, headers=headers, data=entry)
-                else:
-                    class MockResponse:
-                        ok = True
-                        status_code = 200
-                        text = 'Debug mode: simulated response'
-                    response = MockResponse()
+                response = submit_entry(url, headers, entry)
 
-                date_display = entry['model[Date]'][:10]
                 if response.ok:
+                    sent.append(date_display)
+                    submitted.append(entry)
                     log_message(f"✅ {date_display} submitted successfully.")
                 else:
+                    failed.append(date_display)
                     log_message(f"❌ Failed {date_display} - {response.status_code}: {response.text}")
             except Exception as e:
-                log_message(f"❌ Network error on {entry['model[Date]'][:10]}: {e}")
+                failed.append(date_display)
+                log_message(f"❌ Network error on {date_display}: {e}")
 
     # Submit OFF entries for missing weekdays
     if not handled_dates:
         log_message("⚠️ No dates found in CSV to infer OFF days.")
+        report_run_summary(sent, failed, not_sent)
         return
 
-    month_year_pairs = set((d.year, d.month) for d in handled_dates)
-
-    print(month_year_pairs)
-
-    for year, month in month_year_pairs:
-        for day in get_all_days(year, month):
-            if day not in handled_dates:
-                header_id = get_header_id_for_date(month_header_dict, day.isoformat())
-                date_str = day.strftime("%Y-%m-%dT00:00:00")
-                entry_id = None
+    for day in get_missing_days(handled_dates):
+        if should_stop(cancel, deadline):
+            not_sent.append(day.isoformat())
+            continue
+
+        header_id = get_header_id_for_date(month_header_dict, day.isoformat())
+        date_str = day.strftime("%Y-%m-%dT00:00:00")
+        entry_id = None
+
+        if edit:
+            existing = fetch_existing_entries(header_id, cookie)
+            entry_id = existing.get(day.isoformat(), "00000000-0000-0000-0000-000000000000")
+
+        payload = {
+            "model[ID]": entry_id,
+            "model[LogBookHeaderID]": header_id,
+            "model[Date]": date_str,
+            "model[Activity]": "OFF",
+            "model[ClockIn]": "OFF",
+            "model[ClockOut]": "OFF",
+            "model[Description]": "OFF",
+            "model[flagjulyactive]": "false"
+        }
 
-                if edit:
-                    existing = fetch_existing_entries(header_id, cookie)
-                    entry_id = existing.get(day.isoformat(), "00000000-0000-0000-0000-000000000000")
+        try:
+            response = submit_entry(url, headers, payload)
+
+            if response.ok:
+                sent.append(day.isoformat())
+                submitted.append(payload)
+                log_message(f"🟡 OFF submitted for {day}")
+            else:
+                failed.append(day.isoformat())
+                log_message(f"❌ Failed OFF for {day}: {response.status_code} - {response.text}")
+        except Exception as e:
+            failed.append(day.isoformat())
+            log_message(f"❌ Network error submitting OFF for {day}: {e}")
 
-                payload = {
-                    "model[ID]": entry_id,
-                    "model[LogBookHeaderID]": header_id,
-                    "model[Date]": date_str,
-                    "model[Activity]": "OFF",
-                    "model[ClockIn]": "OFF",
-                    "model[ClockOut]": "OFF",
-                    "model[Description]": "OFF",
-                    "model[flagjulyactive]": "false"
-                }
+    if verify and submitted and not should_stop(cancel, deadline):
+        if debugging_mode:
+            log_message("Debug mode: skipping verification of simulated submissions.")
+        else:
+            log_message("Verifying submitted entries...")
+            mismatches, unverified = verify_submissions(submitted, cookie, cancel, deadline)
+            if unverified:
+                log_message(f"⚠️ Not verified: {', '.join(unverified)}")
+
+            for payload in mismatches:
+                date_display = payload["model[Date]"][:10]
+                if should_stop(cancel, deadline):
+                    sent.remove(date_display)
+                    not_sent.append(date_display)
+                    continue
 
                 try:
-                    if not debugging_mode:
-                        response = requests.post(url, data=payload, headers=headers)
-                    else:
-                        class MockResponse:
-                            ok = True
-                            status_code = 200
-                            text = 'Debug mode: simulated response'
-                        response = MockResponse()
-
+                    response = submit_entry(url, headers, payload)
                     if response.ok:
-                        log_message(f"🟡 OFF submitted for {day}")
+                        log_message(f"🔁 {date_display} re-sent after mismatch.")
                     else:
-                        log_message(f"❌ Failed OFF for {day}: {response.status_code} - {response.text}")
+                        sent.remove(date_display)
+                        failed.append(date_display)
+                        log_message(f"❌ Failed re-sending {date_display} - {response.status_code}: {response.text}")
                 except Exception as e:
-                    log_message(f"❌ Network error submitting OFF for {day}: {e}")
+                    sent.remove(date_display)
+                    failed.append(date_display)
+                    log_message(f"❌ Network error re-sending {date_display}: {e}")
+
+    if cancel is not None and cancel.is_set():
+        log_message("⚠️ Run cancelled before all entries were sent.")
+    report_run_summary(sent, failed, not_sent)
 
 # === GUI SETUP ===
 def browse_file():
@@ -505,6 +844,7 @@ def start_process():
     # clock_in = entry_clockin.get().strip() or "09:00 am"
     # clock_out = entry_clockout.get().strip() or "06:00 pm"
     is_edit = edit_mode.get()
+    is_verify = verify_mode.get()
 
     if not (file_path):
         messagebox.showerror("Missing Info", "Please fill in all fields.")
@@ -522,50 +862,61 @@ def start_process():
     
     
 
-    thread = threading.Thread(target=process_logbook, args=(file_path, cookie, is_edit, month_header_dict))
+    cancel, deadline = new_deadline()
+
+    def run_logbook():
+        begin_run(cancel, "submit")
+        try:
+            process_logbook(file_path, cookie, is_edit, month_header_dict, cancel, deadline, is_verify)
+        finally:
+            finish_run(cancel)
+
+    thread = threading.Thread(target=run_logbook)
     thread.start()
 
 def get_cookie_and_header():
-    def on_credentials_gathered(email, password, remember_me):
+    def on_credentials_gathered(email, password, remember_me, saved=False):
         if not email or not password:
             messagebox.showerror("Credentials Missing", "Email and password are required.")
             return
 
-        log_message("Launching browser for cookie/header retrieval...")
-
         # Save credentials if "Remember Me" is checked
         if remember_me:
             save_credentials(email, password)
         
+        cancel, deadline = new_deadline()
+
         # Create a separate function to run the async task in a new thread
         def fetch_data():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            begin_run(cancel, "login")
+            if saved:
+                log_message("✅ Using saved credentials.")
+            log_message("Launching browser for cookie/header retrieval...")
             try:
-                # Call the async function inside the thread
+                # Run the async function on the browser pool's loop and wait for it here
                 global cookie, month_header_dict
-                cookie, month_header_dict = loop.run_until_complete(launch_and_get_cookie_and_header_async(email, password))
-                # Update the GUI fields with the fetched data
+                cookie, month_header_dict = browser_pool.submit(
+                    run_cancellable(launch_and_get_cookie_and_header_async(email, password), cancel, deadline)
+                ).result()
                 if cookie is not None and month_header_dict is not None:
-                    root.after(0, update_gui_fields)
+                    log_message("✅ Cookie and Header ID retrieved.")
 
+            except (asyncio.CancelledError, concurrent.futures.CancelledError):
+                log_message("⚠️ Login cancelled. Cookie and Header ID were not updated.")
             except Exception as e:
                 log_message(f"❌ Failed to get cookie and header: {e}")
                 log_message("❌❌❌ Something went wrong! Please click on 'Fetch Cookies & Header ID' again. 🛠️🔄")
+            finally:
+                finish_run(cancel)
 
-        
         # Start the fetch_data function in a new thread
         threading.Thread(target=fetch_data, daemon=True).start()
 
-    def update_gui_fields():
-        log_message("✅ Cookie and Header ID retrieved.")
-
     # Try to load saved data first
     email, password = load_json()
 
     if email and password:
-        log_message("✅ Using saved credentials.")
-        on_credentials_gathered(email, password, remember_me=True)
+        on_credentials_gathered(email, password, remember_me=True, saved=True)
     else:
         # Ask user if no saved credentials
         dialog = CustomDialog(root, "Login", "Enter your email:", "Enter your password:")
@@ -589,8 +940,12 @@ def show_help_popup():
         "    - Opens browser, logs in to BINUS Enrichment, and grabs session info needed for submission.\n\n"
         "4. 'Edit existing entries'\n"
         "    - Turn this ON if you want to update already-submitted entries.\n\n"
+        "    'Verify after submit'\n"
+        "    - Re-reads each month after submitting and re-sends entries the server stored differently.\n\n"
         "5. 'Submit Logbook'\n"
-        "    - Submits your entries.\n"
+        "    - Submits your entries.\n\n"
+        "6. 'Cancel'\n"
+        "    - Stops a running login or submission. Entries already sent are kept.\n"
     )
 
     text_box = tk.Text(help_win, wrap=tk.WORD, width=60, height=20)
@@ -612,6 +967,7 @@ icon_path = os.path.join(base_path, 'logo.ico')
 root.iconbitmap(icon_path)
 
 edit_mode = tk.BooleanVar()
+verify_mode = tk.BooleanVar()
 
 # === Row 0: File Selection ===
 tk.Label(root, text="Logbook CSV File:").grid(row=0, column=0, sticky="e")
@@ -627,9 +983,11 @@ tk.Button(root, text="Fetch Cookie & Header ID", command=get_cookie_and_header,
 
 # === Row 3: Edit Mode Checkbox ===
 tk.Checkbutton(root, text="Edit existing entries (turn this ON to update)", variable=edit_mode).grid(row=3, column=1, pady=4, sticky="w")
+tk.Checkbutton(root, text="Verify after submit", variable=verify_mode).grid(row=3, column=2, pady=4, sticky="w")
 
 # === Row 4: Submit Button ===
 tk.Button(root, text="Submit Logbook", command=start_process, bg="green", fg="white").grid(row=4, column=1, pady=4, sticky="w")
+tk.Button(root, text="Cancel", command=cancel_run, bg="red", fg="white").grid(row=4, column=2, pady=4, sticky="w")
 
 # === Row 5: Help Button ===
 tk.Button(root, text="❓ How to Use", command=show_help_popup).grid(row=5, column=1, pady=4, sticky="w")
@@ -637,7 +995,20 @@ tk.Button(root, text="❓ How to Use", command=show_help_popup).grid(row=5, colu
 # === Row 6: Output Box ===
 output_box = scrolledtext.ScrolledText(root, width=80, height=20, state='normal')
 output_box.grid(row=6, column=0, columnspan=3, padx=10, pady=10)
+output_box.tag_config("green", foreground="green")
+output_box.tag_config("red", foreground="red")
+output_box.tag_config("blue", foreground="blue")
+output_box.tag_config("black", foreground="black")
+
+def on_close():
+    # Stop in-flight logins first so the browser can be closed cleanly
+    cancel_run()
+    browser_pool.shutdown()
+    root.destroy()
+
+root.protocol("WM_DELETE_WINDOW", on_close)
 
 # === Load Configs & Start GUI ===
 load_json()
+drain_log_queue()
 root.mainloop()
@@ -0,0 +1,132 @@
+import contextvars
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+LOG_FILE = "run_log.jsonl"
+MAX_BYTES = 1024 * 1024  # Rotate once the active log reaches 1 MB
+BACKUP_COUNT = 5  # Keep this many compressed old logs, the oldest is deleted
+
+# Per thread/task, so concurrent login and submit runs keep their own IDs.
+# New threads start without a run; asyncio tasks inherit the run of the thread that scheduled them.
+current_run_id = contextvars.ContextVar("current_run_id", default=None)
+_logger = None
+_logger_lock = threading.Lock()
+
+
+class JsonLineFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps({
+            "ts": datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S"),
+            "run": record.run_id,
+            "level": record.run_level,
+            "msg": record.getMessage(),
+        }, ensure_ascii=False)
+
+
+def _gzip_namer(name):
+    return name + ".gz"
+
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def get_logger(path=LOG_FILE, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    # The handler keeps the file open, so each line is a write instead of an open/close pair
+    global _logger
+    with _logger_lock:
+        if _logger is not None:
+            return _logger
+
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+        handler.setFormatter(JsonLineFormatter())
+
+        _logger = logging.getLogger("binus_logbook.run")
+        _logger.setLevel(logging.INFO)
+        _logger.propagate = False
+        _logger.addHandler(handler)
+        return _logger
+
+
+def start_run(kind):
+    # Call from the worker thread that performs the run
+    run_id = uuid.uuid4().hex[:8]
+    current_run_id.set(run_id)
+    write(f"Run started: {kind}", level="start")
+    return run_id
+
+
+def level_for_message(message):
+    if "❌" in message:
+        return "failure"
+    if "⚠️" in message:
+        return "warning"
+    return "info"
+
+
+def write(message, level=None, run_id=None):
+    # run_id overrides the current run, for lines logged on behalf of another thread's run
+    get_logger().info(message, extra={
+        "run_id": run_id or current_run_id.get(),
+        "run_level": level or level_for_message(message),
+    })
+
+
+def log_files(path=LOG_FILE, backup_count=BACKUP_COUNT):
+    # Newest first: the active file, then path.1.gz, path.2.gz, ...
+    files = [path]
+    for i in range(1, backup_count + 1):
+        files.append(_gzip_namer(f"{path}.{i}"))
+    return [f for f in files if os.path.exists(f)]
+
+
+def query_run(run_id, level=None, path=LOG_FILE, backup_count=BACKUP_COUNT):
+    """
+    Returns the records of one run, optionally filtered by level (e.g. 'failure').
+    Files are read newest first and the search stops at the file holding the run's
+    start record, so older history is never decompressed.
+    """
+    needle = json.dumps({"run": run_id})[1:-1]  # '"run": "<id>"' exactly as the formatter writes it
+    chunks = []
+    for file in log_files(path, backup_count):
+        opener = gzip.open if file.endswith(".gz") else open
+        records = []
+        found_start = False
+        with opener(file, "rt", encoding="utf-8") as f:
+            for line in f:
+                if needle not in line:
+                    continue
+                record = json.loads(line)
+                if record["level"] == "start":
+                    found_start = True
+                if level is None or record["level"] == level:
+                    records.append(record)
+        chunks.append(records)
+        if found_start:
+            break
+
+    # Chunks were collected newest file first, put them back in chronological order
+    return [record for records in reversed(chunks) for record in records]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show records of one logbook run.")
+    parser.add_argument("run_id", help="Run ID shown at the start of the run.")
+    parser.add_argument("--level", help="Only show this level (start, info, warning, failure).")
+    args = parser.parse_args()
+
+    for record in query_run(args.run_id, args.level):
+        print(f"[{record['ts']}] [{record['level']}] {record['msg']}")
@@ -9,6 +9,11 @@ def get_all_days(year, month):
     delta = next_month - first_day
     return [first_day + timedelta(days=i) for i in range(delta.days)]
 
+def get_missing_days(handled_dates):
+    # Every day in the months of handled_dates that is not itself in handled_dates, in order
+    month_year_pairs = sorted(set((d.year, d.month) for d in handled_dates))
+    return [day for year, month in month_year_pairs for day in get_all_days(year, month) if day not in handled_dates]
+
 def parse_flexible_date(date_str):
     # If date_str is already a datetime object, convert it to a string
     if isinstance(date_str, datetime):